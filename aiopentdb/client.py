@@ -6,24 +6,35 @@
     :license: MIT, see LICENSE for more details.
 """
 
+import asyncio
 import collections
+import functools
+import time
 
 import aiohttp
-import attr
 import yarl
 
+try:
+    import orjson as json
+except ImportError:
+    import json
+
+try:
+    import aiodns
+except ImportError:
+    aiodns = None
+
 from .enums import CategoryType
-from .errors import InvalidParameter, NoResults, TokenEmpty, TokenNotFound
+from .errors import HTTPError, InvalidParameter, NoResults, TokenEmpty, TokenNotFound
 from .iterators import _AsyncQuestionsIterator, _QuestionsIterator
 from .objects import Category, Count, GlobalCount
 
 __all__ = ('Settings', 'Client')
 
-@attr.s(slots=True)
 class Settings:
-    """Dataclass representing a cache settings for :class:`.Client`.
+    """Class representing a cache settings for :class:`.Client`.
 
-    This dataclass is used to configure how the client's internal cache should be populated.
+    This class is used to configure how the client's internal cache should be populated.
 
     Attributes
     ----------
@@ -31,6 +42,8 @@ class Settings:
         Denotes whether to populate :class:`.Client` internal token cache or not.
     questions: :class:`bool`
         Denotes whether to populate :class:`.Client` internal question cache or not.
+    categories: :class:`bool`
+        Denotes whether to populate :class:`.Client` internal category cache or not.
     counts: :class:`bool`
         Denotes whether to populate :class:`.Client` internal count cache or not.
     global_counts: :class:`bool`
@@ -53,24 +66,61 @@ class Settings:
         Encoding of the API responses to be used.
     """
 
-    token = attr.ib(False, kw_only=True)
-    questions = attr.ib(False, kw_only=True)
-    categories = attr.ib(False, kw_only=True)
-    counts = attr.ib(False, kw_only=True)
-    global_counts = attr.ib(False, kw_only=True)
+    __slots__ = (
+        'token', 'questions', 'categories', 'counts', 'global_counts', 'overwrite', 'category',
+        'difficulty', 'question', 'encoding'
+    )
 
-    overwrite = attr.ib(False, kw_only=True)
+    def __init__(
+        self, *,
+        token=False,
+        questions=False,
+        categories=False,
+        counts=False,
+        global_counts=False,
+        overwrite=False,
+        category=None,
+        difficulty=None,
+        question=None,
+        encoding=None
+    ):
+        self.token = token
+        self.questions = questions
+        self.categories = categories
+        self.counts = counts
+        self.global_counts = global_counts
 
-    category = attr.ib(None, kw_only=True)
-    difficulty = attr.ib(None, kw_only=True)
-    question = attr.ib(None, kw_only=True)
-    encoding = attr.ib(None, kw_only=True)
+        self.overwrite = overwrite
+
+        self.category = category
+        self.difficulty = difficulty
+        self.question = question
+        self.encoding = encoding
+
+    def __repr__(self):
+        attributes = ('{0}={1!r}'.format(name, getattr(self, name)) for name in self.__slots__)
+        return 'Settings({0})'.format(', '.join(attributes))
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
 
 class Client:
     """Class representing an OpenTDB client.
 
     This class is used to interact with the API and handle cache.
 
+    The client can be used as an async context manager, which closes the internal session on
+    exit:
+
+    .. code-block:: python3
+
+        async with aiopentdb.Client() as client:
+            ...
+
     Parameters
     ----------
     session: Optional[:class:`aiohttp.ClientSession`]
@@ -85,6 +135,11 @@ class Client:
         Settings to be used when populating the internal cache.
 
         Defaults to ``Settings()``.
+    response_ttl: :class:`float`
+        Number of seconds to reuse category and count API responses for. ``0`` disables
+        response reuse.
+
+        Defaults to ``3600``.
 
     Attributes
     ----------
@@ -97,6 +152,11 @@ class Client:
     """
 
     _BASE_URL = yarl.URL('https://opentdb.com/')
+    _QUESTIONS_URL = _BASE_URL / 'api.php'
+    _TOKEN_URL = _BASE_URL / 'api_token.php'
+    _CATEGORIES_URL = _BASE_URL / 'api_category.php'
+    _COUNT_URL = _BASE_URL / 'api_count.php'
+    _GLOBAL_COUNTS_URL = _BASE_URL / 'api_count_global.php'
     _ERRORS = {
         None: None,
         0: None,
@@ -110,10 +170,13 @@ class Client:
         self, *,
         session=None,
         max_questions=50,
-        settings=None
+        settings=None,
+        response_ttl=3600
     ):
         if max_questions < 0:
             raise ValueError('max_questions must be non-negative')
+        if response_ttl < 0:
+            raise ValueError('response_ttl must be non-negative')
 
         self.session = session
         self.settings = settings or Settings()
@@ -124,6 +187,10 @@ class Client:
         self._counts = {}
         self._global_counts = {}
 
+        self._response_ttl = response_ttl
+        self._responses = {}
+        self._pending = {}
+
     @property
     def token(self):
         """Optional[:class:`str`]: Cached session token. ``None`` when not populated."""
@@ -153,18 +220,51 @@ class Client:
 
         return list(self._global_counts.values())
 
-    async def _request(self, method, endpoint, **options):
+    async def _request(self, method, url, **options):
         if self.session is None:
-            self.session = aiohttp.ClientSession(raise_for_status=True)
+            connector = aiohttp.TCPConnector(
+                limit=10,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+                resolver=aiohttp.AsyncResolver() if aiodns is not None else None
+            )
+            self.session = aiohttp.ClientSession(connector=connector)
 
-        async with self.session.request(method, self._BASE_URL / endpoint, **options) as response:
-            payload = await response.json()
+        async with self.session.request(method, url, **options) as response:
+            if response.status >= 400:
+                raise HTTPError(response.status)
+            body = await response.read()
+
+        payload = json.loads(body)
 
         error_type = self._ERRORS[payload.pop('response_code', None)]
         if error_type is not None:
             raise error_type()
         return payload
 
+    async def _request_once(self, method, url, *, refresh=False, **options):
+        params = options.get('params')
+        key = (method, url, tuple(sorted(params.items())) if params else ())
+
+        response = self._responses.get(key)
+        if response is not None and not refresh:
+            expires_at, payload = response
+            if time.monotonic() < expires_at:
+                return payload
+            del self._responses[key]
+
+        future = self._pending.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._request(method, url, **options))
+            future.add_done_callback(functools.partial(self._finish_request, key))
+            self._pending[key] = future
+        return await asyncio.shield(future)
+
+    def _finish_request(self, key, future):
+        del self._pending[key]
+        if self._response_ttl and not future.cancelled() and future.exception() is None:
+            self._responses[key] = (time.monotonic() + self._response_ttl, future.result())
+
     # token
 
     async def fetch_token(self):
@@ -179,7 +279,7 @@ class Client:
         params = {
             'command': 'request'
         }
-        payload = await self._request('GET', 'api_token.php', params=params)
+        payload = await self._request('GET', self._TOKEN_URL, params=params)
         return payload['token']
 
     async def reset_token(self, token=None):
@@ -210,7 +310,7 @@ class Client:
             'command': 'reset',
             'token': token
         }
-        payload = await self._request('GET', 'api_token.php', params=params)
+        payload = await self._request('GET', self._TOKEN_URL, params=params)
         new_token = payload['token']
 
         if is_internal:
@@ -352,18 +452,28 @@ class Client:
     # category
 
     def _create_categories(self, payload):
-        return [Category(data) for data in payload]
+        return [Category._from_data(data) for data in payload]
 
-    async def fetch_categories(self):
+    async def fetch_categories(self, *, refresh=False):
         """Fetches all categories.
 
+        The API response is reused for ``response_ttl`` seconds (see :class:`.Client`).
+
+        Parameters
+        ----------
+        refresh: :class:`bool`
+            Denotes whether to ignore a previously reused API response and request a new one
+            or not.
+
+            Defaults to ``False``.
+
         Returns
         -------
         List[:class:`.Category`]
             List of fetched categories.
         """
 
-        payload = await self._request('GET', 'api_category.php')
+        payload = await self._request_once('GET', self._CATEGORIES_URL, refresh=refresh)
         return self._create_categories(payload['trivia_categories'])
 
     def get_category(self, type):
@@ -385,15 +495,22 @@ class Client:
     # count
 
     def _create_count(self, payload):
-        return Count(self, payload)
+        return Count._from_payload(self, payload['category_question_count'], payload['category_id'])
 
-    async def fetch_count(self, category):
+    async def fetch_count(self, category, *, refresh=False):
         """Fetches a specific count.
 
+        The API response is reused for ``response_ttl`` seconds (see :class:`.Client`).
+
         Parameters
         ----------
         category: :class:`.CategoryType`
             Category type of the count to be fetched.
+        refresh: :class:`bool`
+            Denotes whether to ignore a previously reused API response and request a new one
+            or not.
+
+            Defaults to ``False``.
 
         Returns
         -------
@@ -404,11 +521,8 @@ class Client:
         params = {
             'category': category.value
         }
-        payload = await self._request('GET', 'api_count.php', params=params)
-
-        actual_payload = payload['category_question_count']
-        actual_payload['id'] = payload['category_id']
-        return self._create_count(actual_payload)
+        payload = await self._request_once('GET', self._COUNT_URL, refresh=refresh, params=params)
+        return self._create_count(payload)
 
     def get_count(self, category):
         """Retrieves a specific count from the internal count cache.
@@ -429,22 +543,31 @@ class Client:
     # global count
 
     def _create_global_counts(self, payload):
-        global_counts = [GlobalCount(self, payload['overall'])]
-        for id, data in payload['categories'].items():
-            data['id'] = int(id)
-            global_counts.append(GlobalCount(self, data))
-        return global_counts
+        categories = payload['categories'].items()
+        return [GlobalCount._from_payload(self, payload['overall'])] + [
+            GlobalCount._from_payload(self, data, int(id)) for id, data in categories
+        ]
 
-    async def fetch_global_counts(self):
+    async def fetch_global_counts(self, *, refresh=False):
         """Fetches all global counts.
 
+        The API response is reused for ``response_ttl`` seconds (see :class:`.Client`).
+
+        Parameters
+        ----------
+        refresh: :class:`bool`
+            Denotes whether to ignore a previously reused API response and request a new one
+            or not.
+
+            Defaults to ``False``.
+
         Returns
         -------
         List[:class:`.GlobalCount`]
             List of fetched global counts.
         """
 
-        payload = await self._request('GET', 'api_count_global.php')
+        payload = await self._request_once('GET', self._GLOBAL_COUNTS_URL, refresh=refresh)
         return self._create_global_counts(payload)
 
     def get_global_count(self, category):
@@ -465,9 +588,58 @@ class Client:
 
     # tools
 
+    async def _populate_token(self, settings):
+        if self._token is None or settings.overwrite:
+            self._token = await self.fetch_token()
+
+    async def _populate_questions(self, settings, token_task=None):
+        if settings.overwrite:
+            questions_amount = self._questions.maxlen
+        else:
+            questions_amount = self._questions.maxlen - len(self._questions)
+
+        if questions_amount <= 0:
+            return
+
+        if token_task is not None:
+            await token_task
+
+        questions_iterator = self.fetch_questions(
+            amount=questions_amount,
+            category=settings.category,
+            difficulty=settings.difficulty,
+            type=settings.question,
+            encoding=settings.encoding
+        )
+        self._questions.extend(await questions_iterator.flatten())
+
+    async def _populate_categories(self, settings):
+        if not self._categories or settings.overwrite:
+            for category in await self.fetch_categories(refresh=settings.overwrite):
+                self._categories[category.type.value] = category
+
+    async def _populate_counts(self, settings):
+        if not self._counts or settings.overwrite:
+            counts = await asyncio.gather(*(
+                self.fetch_count(category_type, refresh=settings.overwrite)
+                for category_type in CategoryType
+            ))
+            for category_type, count in zip(CategoryType, counts):
+                self._counts[category_type.value] = count
+
+    async def _populate_global_counts(self, settings):
+        if not self._global_counts or settings.overwrite:
+            for global_count in await self.fetch_global_counts(refresh=settings.overwrite):
+                category_type = getattr(global_count.category, 'type', None)
+                category_value = category_type.value if category_type is not None else None
+                self._global_counts[category_value] = global_count
+
     async def populate(self, settings=None):
         """Populates the internal cache.
 
+        The token is requested alongside the other entries and only the question
+        population waits for it, so independent requests are performed concurrently.
+
         Parameters
         ----------
         settings: Optiona[:class:`.Settings`]
@@ -478,43 +650,21 @@ class Client:
 
         settings = settings or self.settings
 
+        coros = []
+        token_task = None
         if settings.token:
-            if self._token is None or settings.overwrite:
-                self._token = await self.fetch_token()
-
+            token_task = asyncio.ensure_future(self._populate_token(settings))
+            coros.append(token_task)
         if settings.questions:
-            if settings.overwrite:
-                questions_amount = self._questions.maxlen
-            else:
-                questions_amount = self._questions.maxlen - len(self._questions)
-
-            if questions_amount > 0:
-                questions_iterator = self.fetch_questions(
-                    amount=questions_amount,
-                    category=settings.category,
-                    difficulty=settings.difficulty,
-                    type=settings.question,
-                    encoding=settings.encoding
-                )
-                self._questions.extend(await questions_iterator.flatten())
-
+            coros.append(self._populate_questions(settings, token_task))
         if settings.categories:
-            if not self._categories or settings.overwrite:
-                for category in await self.fetch_categories():
-                    self._categories[category.type.value] = category
-
+            coros.append(self._populate_categories(settings))
         if settings.counts:
-            if not self._counts or settings.overwrite:
-                for category_id in Category._VALUE_MAPPING:
-                    category_type = CategoryType(category_id)
-                    self._counts[category_type.value] = await self.fetch_count(category_type)
-
+            coros.append(self._populate_counts(settings))
         if settings.global_counts:
-            if not self._global_counts or settings.overwrite:
-                for global_count in await self.fetch_global_counts():
-                    category_type = getattr(global_count.category, 'type', None)
-                    category_value = category_type.value if category_type is not None else None
-                    self._global_counts[category_value] = global_count
+            coros.append(self._populate_global_counts(settings))
+
+        await asyncio.gather(*coros)
 
     async def close(self):
         """Closes the internal session if exist."""
@@ -522,3 +672,9 @@ class Client:
         if self.session is None:
             return
         await self.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
@@ -6,11 +6,28 @@
     :license: MIT, see LICENSE for more details.
 """
 
-__all__ = ('OpenTDBError', 'NoResults', 'InvalidParameter', 'TokenNotFound', 'TokenEmpty')
+__all__ = (
+    'OpenTDBError', 'HTTPError', 'NoResults', 'InvalidParameter', 'TokenNotFound', 'TokenEmpty'
+)
 
 class OpenTDBError(Exception):
     """Base error class for all OpenTDB related errors."""
 
+class HTTPError(OpenTDBError):
+    """Error raised when the API responds with an unsuccessful HTTP status.
+
+    This error is a subclass of :class:`.OpenTDBError`.
+
+    Attributes
+    ----------
+    status: :class:`int`
+        HTTP status code of the response.
+    """
+
+    def __init__(self, status):
+        super().__init__('request failed with HTTP status {0}'.format(status))
+        self.status = status
+
 class NoResults(OpenTDBError):
     """Error raised when the API could not return any result.
 
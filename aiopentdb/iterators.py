@@ -6,15 +6,56 @@
     :license: MIT, see LICENSE for more details.
 """
 
-import base64
+import binascii
 import html
+import re
 from urllib import parse
 
+import yarl
+
 from .enums import EncodingType
 from .objects import Question
 
 __all__ = ()
 
+_ENTITY_PATTERN = re.compile(r'&(?:#[0-9]+|#[xX][0-9a-fA-F]+|[a-zA-Z][a-zA-Z0-9]*);')
+_ENTITIES = {
+    '&quot;': '"',
+    '&#039;': "'",
+    '&amp;': '&',
+    '&lt;': '<',
+    '&gt;': '>',
+    '&shy;': '\xad',
+    '&eacute;': '\xe9',
+    '&aacute;': '\xe1',
+    '&oacute;': '\xf3',
+    '&ouml;': '\xf6',
+    '&uuml;': '\xfc',
+    '&ntilde;': '\xf1',
+    '&lsquo;': '\u2018',
+    '&rsquo;': '\u2019',
+    '&ldquo;': '\u201c',
+    '&rdquo;': '\u201d',
+    '&hellip;': '\u2026',
+    '&ndash;': '\u2013',
+    '&mdash;': '\u2014'
+}
+
+def _replace_entity(match, _get_entity=_ENTITIES.get):
+    entity = match.group()
+    return _get_entity(entity) or html.unescape(entity)
+
+def _decode_html(decodable, _substitute=_ENTITY_PATTERN.sub):
+    if '&' not in decodable:
+        return decodable
+    return _substitute(_replace_entity, decodable)
+
+def _decode_url(decodable, _unquote_to_bytes=parse.unquote_to_bytes):
+    return _unquote_to_bytes(decodable).decode('utf-8', 'replace')
+
+def _decode_base64(decodable, _a2b_base64=binascii.a2b_base64):
+    return _a2b_base64(decodable).decode('utf-8')
+
 class _QuestionsIterator:
     __slots__ = (
         '_client', '_questions', '_amount', '_category_type', '_difficulty_type', '_question_type',
@@ -78,12 +119,12 @@ class _QuestionsIterator:
         return self._get_question()
 
 class _AsyncQuestionsIterator:
-    __slots__ = ('_client', '_amounts', '_decoder', '_fetched', '_params')
+    __slots__ = ('_client', '_amounts', '_decoder', '_fetched', '_url_format')
 
     _DECODERS = {
-        None: html.unescape,
-        EncodingType.url: parse.unquote,
-        EncodingType.base64: lambda decodable: base64.b64decode(decodable).decode()
+        None: _decode_html,
+        EncodingType.url: _decode_url,
+        EncodingType.base64: _decode_base64
     }
 
     def __init__(
@@ -102,26 +143,21 @@ class _AsyncQuestionsIterator:
         self._decoder = self._DECODERS[encoding]
         self._fetched = iter(())
 
-        self._params = {}
-        if category is not None:
-            self._params['category'] = category.value
-        if difficulty is not None:
-            self._params['difficulty'] = difficulty.value
-        if type is not None:
-            self._params['type'] = type.value
-        if encoding is not None:
-            self._params['encoding'] = encoding.value
+        options = (
+            ('category', category),
+            ('difficulty', difficulty),
+            ('type', type),
+            ('encode', encoding)
+        )
+        params = {name: option.value for name, option in options if option is not None}
         if token is not None:
-            self._params['token'] = token
+            params['token'] = token
 
-    def _create_questions(self, payload):
-        questions = []
-        for data in payload:
-            data['name'] = data.pop('category')
-            questions.append(Question(self._client, data, self._decoder))
-        return questions
+        # only the amount changes between batches, so the rest of the query is encoded once
+        query = parse.urlencode(params)
+        self._url_format = '{}?{}amount={{}}'.format(client._QUESTIONS_URL, query and query + '&')
 
-    async def _fetch_questions(self):
+    async def _fetch_results(self):
         try:
             amount = next(self._amounts)
         except StopIteration:
@@ -129,18 +165,19 @@ class _AsyncQuestionsIterator:
         else:
             if amount == 0:
                 raise StopAsyncIteration()
-            self._params['amount'] = amount
 
-        payload = await self._client._request('GET', 'api.php', params=self._params)
-        return self._create_questions(payload['results'])
+        url = yarl.URL(self._url_format.format(amount), encoded=True)
+        payload = await self._client._request('GET', url)
+        return payload['results']
 
     async def flatten(self):
         questions = []
         while True:
             try:
-                questions.extend(await self._fetch_questions())
+                results = await self._fetch_results()
             except StopAsyncIteration:
                 return questions
+            questions.extend(Question._from_batch(self._client, results, self._decoder))
 
     def __aiter__(self):
         return self
@@ -150,4 +187,5 @@ class _AsyncQuestionsIterator:
             try:
                 return next(self._fetched)
             except StopIteration:
-                self._fetched = iter(await self._fetch_questions())
+                results = await self._fetch_results()
+                self._fetched = iter(Question._from_batch(self._client, results, self._decoder))
@@ -6,19 +6,34 @@
     :license: MIT, see LICENSE for more details.
 """
 
+import collections
+import operator
 import random
 
-import attr
-
 from .enums import CategoryType, DifficultyType, QuestionType
 
 __all__ = ('Category', 'Count', 'GlobalCount', 'Question')
 
-def _bypass_setter(target):
-    def new_setter(name, value):
-        object.__setattr__(target, name, value)
-
-    return new_setter
+_getrandbits = random.getrandbits
+_shuffle = random.shuffle
+_setattr = object.__setattr__
+
+_CATEGORY_TYPES = CategoryType._value_mapping
+_QUESTION_TYPES = QuestionType._value_mapping
+_DIFFICULTY_TYPES = DifficultyType._value_mapping
+
+_get_count_fields = operator.itemgetter(
+    'total_question_count',
+    'total_easy_question_count',
+    'total_medium_question_count',
+    'total_hard_question_count'
+)
+_get_global_count_fields = operator.itemgetter(
+    'total_num_of_questions',
+    'total_num_of_pending_questions',
+    'total_num_of_verified_questions',
+    'total_num_of_rejected_questions'
+)
 
 def _get_category_mappings():
     names = (
@@ -56,9 +71,8 @@ def _get_category_mappings():
 
     return name_mapping, value_mapping
 
-@attr.s(frozen=True, slots=True, init=False)
-class Category:
-    """Dataclass representing an OpenTDB category.
+class Category(collections.namedtuple('Category', 'name id type')):
+    """Named tuple representing an OpenTDB category.
 
     Attributes
     ----------
@@ -70,35 +84,30 @@ class Category:
         Type of the category.
     """
 
-    name = attr.ib()
-    id = attr.ib()
-    type = attr.ib()
+    __slots__ = ()
 
     _NAME_MAPPING, _VALUE_MAPPING = _get_category_mappings()
 
-    def __init__(self, data):
-        new_setter = _bypass_setter(self)
-        new_setter('name', data['name'])
-        new_setter('id', data['id'])
-        new_setter('type', CategoryType(self.id))
+    @classmethod
+    def _from_data(cls, data):
+        id = data['id']
+        return cls(data['name'], id, _CATEGORY_TYPES[id])
 
     @classmethod
-    def _from_partial(cls, client, data):
-        name = data.get('name')
-        id = data.get('id')
+    def _from_partial(cls, client, *, name=None, id=None):
+        if id is None:
+            if name is None:
+                return None
+            id = cls._NAME_MAPPING[name]
 
-        if name is not None:
-            id = id or cls._NAME_MAPPING[name]
-        elif id is not None:
-            name = name or cls._VALUE_MAPPING[id]
-        else:
-            return None
+        return client._categories.get(id) or _DEFAULT_CATEGORIES[id]
 
-        return client._categories.get(id) or cls({'name': name, 'id': id})
+_DEFAULT_CATEGORIES = {
+    id: Category(name, id, _CATEGORY_TYPES[id]) for id, name in Category._VALUE_MAPPING.items()
+}
 
-@attr.s(frozen=True, slots=True, init=False)
-class Count:
-    """Dataclass representing an OpenTDB count.
+class Count(collections.namedtuple('Count', 'total easy medium hard category')):
+    """Named tuple representing an OpenTDB count.
 
     Attributes
     ----------
@@ -114,23 +123,16 @@ class Count:
         Category that the count belongs to.
     """
 
-    total = attr.ib()
-    easy = attr.ib()
-    medium = attr.ib()
-    hard = attr.ib()
-    category = attr.ib()
+    __slots__ = ()
 
-    def __init__(self, client, data):
-        new_setter = _bypass_setter(self)
-        new_setter('total', data['total_question_count'])
-        new_setter('easy', data['total_easy_question_count'])
-        new_setter('medium', data['total_medium_question_count'])
-        new_setter('hard', data['total_hard_question_count'])
-        new_setter('category', Category._from_partial(client, data))
+    @classmethod
+    def _from_payload(cls, client, data, id):
+        return cls(*_get_count_fields(data), Category._from_partial(client, id=id))
 
-@attr.s(frozen=True, slots=True, init=False)
-class GlobalCount:
-    """Dataclass representing an OpenTDB global count.
+class GlobalCount(
+    collections.namedtuple('GlobalCount', 'total pending verified rejected category')
+):
+    """Named tuple representing an OpenTDB global count.
 
     Attributes
     ----------
@@ -146,23 +148,17 @@ class GlobalCount:
         Category that the global count belongs to. ``None`` for overall global count.
     """
 
-    total = attr.ib()
-    pending = attr.ib()
-    verified = attr.ib()
-    rejected = attr.ib()
-    category = attr.ib()
-
-    def __init__(self, client, data):
-        new_setter = _bypass_setter(self)
-        new_setter('total', data['total_num_of_questions'])
-        new_setter('pending', data['total_num_of_pending_questions'])
-        new_setter('verified', data['total_num_of_verified_questions'])
-        new_setter('rejected', data['total_num_of_rejected_questions'])
-        new_setter('category', Category._from_partial(client, data))
-
-@attr.s(frozen=True, slots=True, init=False)
+    __slots__ = ()
+
+    @classmethod
+    def _from_payload(cls, client, data, id=None):
+        return cls(*_get_global_count_fields(data), Category._from_partial(client, id=id))
+
 class Question:
-    """Dataclass representing an OpenTDB question.
+    """Class representing an OpenTDB question.
+
+    Questions are read-only; assigning or deleting an attribute raises
+    :exc:`AttributeError`.
 
     Attributes
     ----------
@@ -174,32 +170,80 @@ class Question:
         Actual content of the question.
     correct_answer: :class:`str`
         Correct answer of the question.
-    incorrect_answers: List[:class:`str`]
-        List of incorrect answers.
+    incorrect_answers: Tuple[:class:`str`, ...]
+        Tuple of incorrect answers.
     category: :class:`.Category`
         Category that the question belongs to.
     """
 
-    type = attr.ib()
-    difficulty = attr.ib()
-    content = attr.ib(repr=False)
-    correct_answer = attr.ib(repr=False)
-    incorrect_answers = attr.ib(repr=False)
-    category = attr.ib()
-
-    def __init__(self, client, data, decoder):
-        new_setter = _bypass_setter(self)
-        new_setter('type', QuestionType(decoder(data['type'])))
-        new_setter('difficulty', DifficultyType(decoder(data['difficulty'])))
-        new_setter('content', decoder(data['question']))
-        new_setter('correct_answer', decoder(data['correct_answer']))
-        new_setter('incorrect_answers', [decoder(answer) for answer in data['incorrect_answers']])
-        new_setter('category', Category._from_partial(client, data))
-
-    @property
+    __slots__ = (
+        'type', 'difficulty', 'content', 'correct_answer', 'incorrect_answers', 'category',
+        '_answer_pool'
+    )
+
+    def __init__(self, type, difficulty, content, correct_answer, incorrect_answers, category):
+        _setattr(self, 'type', type)
+        _setattr(self, 'difficulty', difficulty)
+        _setattr(self, 'content', content)
+        _setattr(self, 'correct_answer', correct_answer)
+        _setattr(self, 'incorrect_answers', tuple(incorrect_answers))
+        _setattr(self, 'category', category)
+
+        _setattr(self, '_answer_pool', (correct_answer,) + self.incorrect_answers)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("'Question' object is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError("'Question' object is read-only")
+
+    def __reduce__(self):
+        return (
+            self.__class__,
+            (
+                self.type, self.difficulty, self.content, self.correct_answer,
+                self.incorrect_answers, self.category
+            )
+        )
+
+    def __repr__(self):
+        return (
+            'Question(type={0.type!r}, difficulty={0.difficulty!r}, category={0.category!r})'
+        ).format(self)
+
+    @classmethod
+    def _from_batch(cls, client, payload, decoder):
+        question_types = _QUESTION_TYPES
+        difficulty_types = _DIFFICULTY_TYPES
+        get_category = Category._from_partial
+
+        return [
+            cls(
+                question_types[decoder(data['type'])],
+                difficulty_types[decoder(data['difficulty'])],
+                decoder(data['question']),
+                decoder(data['correct_answer']),
+                tuple(map(decoder, data['incorrect_answers'])),
+                get_category(client, name=decoder(data['category']))
+            )
+            for data in payload
+        ]
+
     def answers(self):
-        """List[:class:`str`]: List of shuffled answers."""
+        """Returns the answers of the question in a random order.
+
+        A new shuffled list is returned on every call.
+
+        Returns
+        -------
+        List[:class:`str`]
+            List of shuffled answers.
+        """
+
+        if self.type is QuestionType.boolean:
+            first, second = self._answer_pool
+            return [first, second] if _getrandbits(1) else [second, first]
 
-        answers = [self.correct_answer, *self.incorrect_answers]
-        random.shuffle(answers)
+        answers = list(self._answer_pool)
+        _shuffle(answers)
         return answers
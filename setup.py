@@ -49,7 +49,8 @@ setuptools.setup(
     include_package_data=True,
     install_requires=read('requirements.txt').splitlines(),
     extras_require={
-        'dev': read('requirements-dev.txt').splitlines()
+        'dev': read('requirements-dev.txt').splitlines(),
+        'speedups': ['aiohttp[speedups]', 'orjson']
     },
     python_requires='~=3.6'
 )